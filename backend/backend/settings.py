@@ -96,6 +96,8 @@ DATABASES = {
         'OPTIONS': {
             # 设置数据库锁等待超时（秒），默认5秒太短
             'timeout': 30,
+            # 写事务以 BEGIN IMMEDIATE 开始，提前获取写锁，避免读锁升级时出现 SQLITE_BUSY
+            'transaction_mode': 'IMMEDIATE',
         },
         # 保持连接，减少频繁开关连接的开销
         'CONN_MAX_AGE': 60,
@@ -104,25 +106,79 @@ DATABASES = {
 
 # SQLite PRAGMA 配置 - 在每个连接建立时执行
 # 注意：WAL 模式需要在数据库创建后手动执行或通过 migration 设置
+SQLITE_PRAGMAS = [
+    # 启用 WAL 模式（Write-Ahead Logging）- 允许并发读写
+    'PRAGMA journal_mode=WAL',
+    # 设置 busy_timeout（毫秒）- 等待锁释放的最长时间
+    'PRAGMA busy_timeout=30000',
+    # 启用外键约束
+    'PRAGMA foreign_keys=ON',
+    # 同步模式设置（NORMAL 在 WAL 模式下是安全的，性能更好）
+    'PRAGMA synchronous=NORMAL',
+    # 缓存大小（负数表示 KB，这里是 64MB）
+    'PRAGMA cache_size=-64000',
+]
+# 合并为一个脚本，一次调用执行全部 PRAGMA
+SQLITE_PRAGMA_SCRIPT = ';\n'.join(SQLITE_PRAGMAS) + ';'
+
+
 def configure_sqlite_pragma(sender, connection, **kwargs):
     """配置 SQLite PRAGMA 设置以优化并发性能"""
-    if connection.vendor == 'sqlite':
-        cursor = connection.cursor()
-        # 启用 WAL 模式（Write-Ahead Logging）- 允许并发读写
-        cursor.execute('PRAGMA journal_mode=WAL;')
-        # 设置 busy_timeout（毫秒）- 等待锁释放的最长时间
-        cursor.execute('PRAGMA busy_timeout=30000;')
-        # 启用外键约束
-        cursor.execute('PRAGMA foreign_keys=ON;')
-        # 同步模式设置（NORMAL 在 WAL 模式下是安全的，性能更好）
-        cursor.execute('PRAGMA synchronous=NORMAL;')
-        # 缓存大小（负数表示 KB，这里是 64MB）
-        cursor.execute('PRAGMA cache_size=-64000;')
+    # 内存数据库（如测试库）不支持 WAL，跳过全部 PRAGMA
+    if connection.vendor == 'sqlite' and not connection.is_in_memory_db():
+        # 直接在底层 sqlite3 连接上执行脚本
+        connection.connection.executescript(SQLITE_PRAGMA_SCRIPT)
 
 from django.db.backends.signals import connection_created
 connection_created.connect(configure_sqlite_pragma)
 
 
+# Cache
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # 登录密码校验结果只能保存在进程内存中，不要改为文件、数据库或外部缓存
+    'login': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'login',
+    },
+}
+
+
+# Password hashing
+# 配置 DJANGO_PASSWORD_PEPPER 后，密码先用 pepper 做 HMAC 预哈希再交给 Argon2；
+# 未配置时使用不带 pepper 的 Argon2（`manage.py check --deploy` 会给出警告），升级时无需额外配置。
+# 其余哈希器用于校验旧密码，并在登录时自动升级为首选哈希器
+# pepper 与 SECRET_KEY 相互独立，轮换 SECRET_KEY 不会使已有密码哈希失效
+PASSWORD_PEPPER = os.environ.get('DJANGO_PASSWORD_PEPPER', '')
+
+# 轮换 pepper 时，将旧 pepper 以逗号分隔放入此变量：旧哈希仍可校验，并在用户登录时改用新 pepper 重新哈希
+PASSWORD_PEPPER_FALLBACKS = [
+    pepper for pepper in os.environ.get('DJANGO_PASSWORD_PEPPER_FALLBACKS', '').split(',') if pepper
+]
+
+# 带 pepper 的哈希器始终保留，未配置 pepper 时仍可借助 FALLBACKS 校验已有哈希
+if PASSWORD_PEPPER:
+    _ARGON2_HASHERS = [
+        'users.hashers.PepperedArgon2PasswordHasher',
+        'django.contrib.auth.hashers.Argon2PasswordHasher',
+    ]
+else:
+    _ARGON2_HASHERS = [
+        'django.contrib.auth.hashers.Argon2PasswordHasher',
+        'users.hashers.PepperedArgon2PasswordHasher',
+    ]
+
+PASSWORD_HASHERS = [
+    *_ARGON2_HASHERS,
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -178,7 +234,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # DRF settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
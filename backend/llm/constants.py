@@ -73,6 +73,12 @@ class AnalysisDefaults:
     # 预测 Token 数（Ollama）
     NUM_PREDICT: int = 1000
 
+    # 发送给模型前图片的最长边（像素），超过时等比缩小
+    IMAGE_MAX_EDGE: int = 1024
+
+    # 缩小后重新编码的 JPEG 质量
+    IMAGE_JPEG_QUALITY: int = 85
+
 
 @dataclass(frozen=True)
 class TaskDefaults:
@@ -60,13 +60,13 @@ class AnalysisStatusConsumer(AsyncWebsocketConsumer):
             ...
         }
         """
-        logger.info(f"[Consumer] 收到分析更新事件: user_id={self.user_id}, event={event}")
+        logger.debug("[Consumer] 收到分析更新事件: user_id=%s, event=%s", self.user_id, event)
         # 发送更新到客户端
         await self.send(text_data=json.dumps({
             'type': 'analysis_update',
             'data': event['data']
         }))
-        logger.info(f"[Consumer] 已发送分析更新到客户端: user_id={self.user_id}")
+        logger.debug("[Consumer] 已发送分析更新到客户端: user_id=%s", self.user_id)
 
     async def stats_update(self, event):
         """
@@ -82,12 +82,12 @@ class AnalysisStatusConsumer(AsyncWebsocketConsumer):
             'failed': int
         }
         """
-        logger.info(f"[Consumer] 收到统计更新事件: user_id={self.user_id}, event={event}")
+        logger.debug("[Consumer] 收到统计更新事件: user_id=%s, event=%s", self.user_id, event)
         await self.send(text_data=json.dumps({
             'type': 'stats_update',
             'data': event['data']
         }))
-        logger.info(f"[Consumer] 已发送统计更新到客户端: user_id={self.user_id}")
+        logger.debug("[Consumer] 已发送统计更新到客户端: user_id=%s", self.user_id)
 
     async def receive(self, text_data):
         """
@@ -26,26 +26,28 @@ class Command(BaseCommand):
 
         self.stdout.write(f'找到 {total} 个 pending 状态的分析任务')
 
-        recovered = 0
-        skipped = 0
-
-        for analysis in pending_analyses:
-            # 检查是否有最近创建的相关任务
-            recent_tasks = Task.objects.filter(
+        # 尚未开始执行的分析任务与 pending 记录无关，循环外查询一次即可
+        recent_tasks = list(
+            Task.objects.filter(
                 func='llm.tasks.execute_analysis_task'
             ).filter(
                 started__isnull=True
             ).order_by('-id')[:10]
+        )
+
+        recovered = 0
+        skipped = 0
 
+        # 只需要 ID，按批次流式读取，避免一次性载入全部记录
+        for analysis_id in pending_analyses.values_list('id', flat=True).iterator(chunk_size=2000):
             # 检查这些任务的参数是否包含当前分析 ID
-            has_task = False
-            for task in recent_tasks:
-                if task.args and str(analysis.id) in task.args:
-                    has_task = True
-                    break
+            has_task = any(
+                task.args and str(analysis_id) in task.args
+                for task in recent_tasks
+            )
 
             if has_task:
-                self.stdout.write(f'跳过分析 {analysis.id}: 已有对应的任务')
+                self.stdout.write(f'跳过分析 {analysis_id}: 已有对应的任务')
                 skipped += 1
                 continue
 
@@ -53,12 +55,12 @@ class Command(BaseCommand):
             try:
                 task_id = async_task(
                     execute_analysis_task,
-                    analysis.id,
+                    analysis_id,
                     save=True
                 )
                 recovered += 1
-                self.stdout.write(self.style.SUCCESS(f'恢复分析 {analysis.id}: 任务 {task_id} 已创建'))
+                self.stdout.write(self.style.SUCCESS(f'恢复分析 {analysis_id}: 任务 {task_id} 已创建'))
             except Exception as e:
-                self.stdout.write(self.style.ERROR(f'恢复分析 {analysis.id} 失败: {str(e)}'))
+                self.stdout.write(self.style.ERROR(f'恢复分析 {analysis_id} 失败: {str(e)}'))
 
         self.stdout.write(self.style.SUCCESS(f'\n恢复完成: {recovered} 个任务已创建, {skipped} 个已跳过'))
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('llm', '0010_add_endpoint_is_default'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='imageanalysis',
+            name='llm_imagean_user_id_cac187_idx',
+        ),
+        migrations.AddIndex(
+            model_name='imageanalysis',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='llm_imagean_user_id_9e599e_idx'),
+        ),
+    ]
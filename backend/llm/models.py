@@ -255,7 +255,8 @@ class ImageAnalysis(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['media', '-created_at']),
-            models.Index(fields=['user', '-created_at']),
+            # 与列表游标分页的排序 (-created_at, -id) 一致，避免排序后再扫描
+            models.Index(fields=['user', '-created_at', '-id']),
             models.Index(fields=['status']),
             models.Index(fields=['error_type']),
             models.Index(fields=['-created_at']),
@@ -31,7 +31,10 @@ def send_analysis_update(user_id, analysis_data):
         channel_layer = get_channel_layer()
         group_name = f"analysis_{user_id}"
 
-        logger.info(f"[WebSocket] 发送分析更新通知: user_id={user_id}, analysis_id={analysis_data.get('id')}, status={analysis_data.get('status')}, group={group_name}")
+        logger.debug(
+            "[WebSocket] 发送分析更新通知: user_id=%s, analysis_id=%s, status=%s, group=%s",
+            user_id, analysis_data.get('id'), analysis_data.get('status'), group_name
+        )
 
         # 异步发送消息到频道组
         async_to_sync(channel_layer.group_send)(
@@ -41,9 +44,9 @@ def send_analysis_update(user_id, analysis_data):
                 'data': analysis_data
             }
         )
-        logger.info(f"[WebSocket] 分析更新通知已发送: user_id={user_id}, analysis_id={analysis_data.get('id')}")
+        logger.debug("[WebSocket] 分析更新通知已发送: user_id=%s, analysis_id=%s", user_id, analysis_data.get('id'))
     except Exception as e:
-        logger.error(f"[WebSocket] 发送分析更新失败: user_id={user_id}, error={str(e)}", exc_info=True)
+        logger.error("[WebSocket] 发送分析更新失败: user_id=%s, error=%s", user_id, e, exc_info=True)
 
 
 def send_stats_update(user_id, stats_data):
@@ -63,7 +66,7 @@ def send_stats_update(user_id, stats_data):
         channel_layer = get_channel_layer()
         group_name = f"analysis_{user_id}"
 
-        logger.info(f"[WebSocket] 发送统计更新通知: user_id={user_id}, stats={stats_data}, group={group_name}")
+        logger.debug("[WebSocket] 发送统计更新通知: user_id=%s, stats=%s, group=%s", user_id, stats_data, group_name)
 
         async_to_sync(channel_layer.group_send)(
             group_name,
@@ -72,6 +75,6 @@ def send_stats_update(user_id, stats_data):
                 'data': stats_data
             }
         )
-        logger.info(f"[WebSocket] 统计更新通知已发送: user_id={user_id}")
+        logger.debug("[WebSocket] 统计更新通知已发送: user_id=%s", user_id)
     except Exception as e:
-        logger.error(f"[WebSocket] 发送统计更新失败: user_id={user_id}, error={str(e)}", exc_info=True)
+        logger.error("[WebSocket] 发送统计更新失败: user_id=%s, error=%s", user_id, e, exc_info=True)
@@ -5,6 +5,9 @@ LLM 模块序列化器
 from rest_framework import serializers
 from .models import Endpoint, AIModel, ImageAnalysis, AnalysisStatus
 
+# 单次批量分析允许提交的最大媒体数量
+MAX_BATCH_ANALYZE_SIZE = 100
+
 
 # ============ 任务相关序列化器 ============
 
@@ -39,9 +42,16 @@ class CreateAnalysisSerializer(serializers.Serializer):
 
 class BatchAnalyzeSerializer(serializers.Serializer):
     """批量分析请求序列化器"""
-    media_ids = serializers.ListField(child=serializers.IntegerField())
+    media_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        max_length=MAX_BATCH_ANALYZE_SIZE
+    )
     model_id = serializers.IntegerField()
 
+    def validate_media_ids(self, value):
+        """去重并保持原有顺序"""
+        return list(dict.fromkeys(value))
+
 
 class BatchAnalysisActionSerializer(serializers.Serializer):
     """批量分析操作序列化器"""
@@ -10,11 +10,16 @@
 
 import base64
 import logging
+from io import BytesIO
 from typing import Optional
 
+from django.db import transaction
+from django.db.models import Count, Q
 from django.utils import timezone
+from PIL import Image, ImageOps
 
 from .providers import get_provider
+from llm.constants import ANALYSIS_DEFAULTS
 from llm.models import (
     ImageAnalysis,
     AIModel,
@@ -30,9 +35,13 @@ from llm.exceptions import (
     classify_exception,
 )
 from llm.notifications import send_analysis_update, send_stats_update
+from media.models import Media, Category
 
 logger = logging.getLogger(__name__)
 
+# 批量创建分析记录时每条 INSERT 的最大行数
+BULK_CREATE_BATCH_SIZE = 100
+
 
 class AnalysisService:
     """
@@ -94,9 +103,69 @@ class AnalysisService:
             status=AnalysisStatus.PENDING
         )
 
-        logger.info(f"创建分析任务: analysis_id={analysis.id}, media_id={media_id}, model_id={model_id}")
+        logger.info("创建分析任务: analysis_id=%s, media_id=%s, model_id=%s", analysis.id, media_id, model_id)
         return analysis
 
+    @staticmethod
+    def create_batch_analyses(
+        media_ids: list[int],
+        model_id: int,
+        user_id: int
+    ) -> tuple[list[ImageAnalysis], int]:
+        """
+        批量创建分析任务
+
+        模型在整个批次中只验证一次，无法创建的媒体计入跳过数
+
+        Args:
+            media_ids: 媒体文件 ID 列表
+            model_id: AI 模型 ID
+            user_id: 用户 ID
+
+        Returns:
+            tuple[list[ImageAnalysis], int]: (创建的分析记录, 跳过数量)
+        """
+        try:
+            model = AnalysisService._validate_model(model_id, user_id)
+        except ModelNotFoundError:
+            return [], len(media_ids)
+
+        # 只取 ID 判断：属于当前用户的图片，且没有待处理/处理中的分析任务
+        valid_ids = set(
+            Media.objects.filter(
+                id__in=media_ids,
+                owner_id=user_id,
+                type='image'
+            ).values_list('id', flat=True)
+        )
+        valid_ids -= set(
+            ImageAnalysis.objects.filter(
+                media_id__in=valid_ids,
+                status__in=[AnalysisStatus.PENDING, AnalysisStatus.PROCESSING]
+            ).values_list('media_id', flat=True)
+        )
+
+        # 按请求顺序创建，重复的 ID 只创建一次
+        analyses = [
+            ImageAnalysis(
+                media_id=media_id,
+                model=model,
+                endpoint_id=model.endpoint_id,
+                user_id=user_id,
+                status=AnalysisStatus.PENDING
+            )
+            for media_id in dict.fromkeys(media_ids)
+            if media_id in valid_ids
+        ]
+        skipped_count = len(media_ids) - len(analyses)
+
+        # 一次批量插入，缩短写锁持有时间
+        if analyses:
+            with transaction.atomic():
+                analyses = ImageAnalysis.objects.bulk_create(analyses, batch_size=BULK_CREATE_BATCH_SIZE)
+
+        return analyses, skipped_count
+
     @staticmethod
     def execute_analysis(analysis_id: int) -> ImageAnalysis:
         """
@@ -113,14 +182,17 @@ class AnalysisService:
         Raises:
             LLMException: 分析过程中的各种错误
         """
-        # 获取分析记录
-        try:
-            analysis = ImageAnalysis.objects.select_related(
-                'media', 'model', 'endpoint', 'user'
-            ).get(id=analysis_id)
-        except ImageAnalysis.DoesNotExist:
+        # 获取分析记录（user 只用到 user_id，无需关联查询）
+        analysis = ImageAnalysis.objects.select_related(
+            'media', 'model', 'endpoint'
+        ).filter(id=analysis_id).first()
+        if analysis is None:
             raise MediaNotFoundError(f"分析记录不存在: analysis_id={analysis_id}")
 
+        # 已取消的记录不再执行，取消操作只需改状态，无需撤回队列中的任务
+        if analysis.status == AnalysisStatus.CANCELLED:
+            return analysis
+
         # 更新状态为处理中
         analysis.status = AnalysisStatus.PROCESSING
         analysis.save(update_fields=['status', 'updated_at'])
@@ -138,13 +210,14 @@ class AnalysisService:
             # 获取提供商并执行分析
             provider = get_provider(analysis.endpoint, analysis.model)
 
-            # 记录请求信息
-            logger.info(
-                f"[分析请求] analysis_id={analysis_id}, "
-                f"provider={analysis.endpoint.provider_type}, "
-                f"endpoint={analysis.endpoint.name}, "
-                f"model={analysis.model.name}, "
-                f"base_url={analysis.endpoint.base_url}"
+            # 记录请求信息（调试级别，生产环境不做格式化）
+            logger.debug(
+                "[分析请求] analysis_id=%s, provider=%s, endpoint=%s, model=%s, base_url=%s",
+                analysis_id,
+                analysis.endpoint.provider_type,
+                analysis.endpoint.name,
+                analysis.model.name,
+                analysis.endpoint.base_url,
             )
 
             result = provider.analyze(image_data, mime_type)
@@ -153,10 +226,11 @@ class AnalysisService:
             AnalysisService._save_success(analysis, result)
 
             logger.info(
-                f"[分析完成] analysis_id={analysis_id}, "
-                f"provider={analysis.endpoint.provider_type}, "
-                f"model={analysis.model.name}, "
-                f"tokens={result.tokens_used}"
+                "[分析完成] analysis_id=%s, provider=%s, model=%s, tokens=%s",
+                analysis_id,
+                analysis.endpoint.provider_type,
+                analysis.model.name,
+                result.tokens_used,
             )
             return analysis
 
@@ -176,31 +250,14 @@ class AnalysisService:
         Returns:
             dict: 统计信息
         """
-        from django.db.models import Count, Case, When, IntegerField
-
-        # 使用单个聚合查询获取所有统计数据
+        # 使用单个聚合查询获取所有统计数据（COUNT ... FILTER）
         stats = ImageAnalysis.objects.filter(user_id=user_id).aggregate(
             total=Count('id'),
-            pending=Count(Case(
-                When(status=AnalysisStatus.PENDING, then=1),
-                output_field=IntegerField()
-            )),
-            processing=Count(Case(
-                When(status=AnalysisStatus.PROCESSING, then=1),
-                output_field=IntegerField()
-            )),
-            completed=Count(Case(
-                When(status=AnalysisStatus.COMPLETED, then=1),
-                output_field=IntegerField()
-            )),
-            failed=Count(Case(
-                When(status=AnalysisStatus.FAILED, then=1),
-                output_field=IntegerField()
-            )),
-            cancelled=Count(Case(
-                When(status=AnalysisStatus.CANCELLED, then=1),
-                output_field=IntegerField()
-            )),
+            pending=Count('id', filter=Q(status=AnalysisStatus.PENDING)),
+            processing=Count('id', filter=Q(status=AnalysisStatus.PROCESSING)),
+            completed=Count('id', filter=Q(status=AnalysisStatus.COMPLETED)),
+            failed=Count('id', filter=Q(status=AnalysisStatus.FAILED)),
+            cancelled=Count('id', filter=Q(status=AnalysisStatus.CANCELLED)),
         )
 
         return stats
@@ -220,10 +277,9 @@ class AnalysisService:
         Raises:
             ValidationError: 状态不允许重试
         """
-        try:
-            analysis = ImageAnalysis.objects.get(id=analysis_id, user_id=user_id)
-        except ImageAnalysis.DoesNotExist:
-            raise MediaNotFoundError(f"分析记录不存在")
+        analysis = ImageAnalysis.objects.filter(id=analysis_id, user_id=user_id).first()
+        if analysis is None:
+            raise MediaNotFoundError("分析记录不存在")
 
         # 检查状态
         if analysis.status == AnalysisStatus.PROCESSING:
@@ -244,7 +300,7 @@ class AnalysisService:
         analysis.error_details = {}
         analysis.save()
 
-        logger.info(f"重试分析: analysis_id={analysis_id}, retry_count={analysis.retry_count}")
+        logger.info("重试分析: analysis_id=%s, retry_count=%s", analysis_id, analysis.retry_count)
         return analysis
 
     @staticmethod
@@ -259,10 +315,9 @@ class AnalysisService:
         Returns:
             ImageAnalysis: 取消后的分析记录
         """
-        try:
-            analysis = ImageAnalysis.objects.get(id=analysis_id, user_id=user_id)
-        except ImageAnalysis.DoesNotExist:
-            raise MediaNotFoundError(f"分析记录不存在")
+        analysis = ImageAnalysis.objects.filter(id=analysis_id, user_id=user_id).first()
+        if analysis is None:
+            raise MediaNotFoundError("分析记录不存在")
 
         if analysis.status not in [AnalysisStatus.PENDING, AnalysisStatus.PROCESSING]:
             raise AnalysisAlreadyExistsError(f"无法取消状态为 {analysis.get_status_display()} 的任务")
@@ -276,11 +331,8 @@ class AnalysisService:
     @staticmethod
     def _validate_media(media_id: int, user_id: int):
         """验证媒体文件"""
-        from media.models import Media
-
-        try:
-            media = Media.objects.get(id=media_id, owner_id=user_id)
-        except Media.DoesNotExist:
+        media = Media.objects.filter(id=media_id, owner_id=user_id).first()
+        if media is None:
             raise MediaNotFoundError(f"媒体文件不存在或无权访问: media_id={media_id}")
 
         if media.type != 'image':
@@ -291,12 +343,11 @@ class AnalysisService:
     @staticmethod
     def _validate_model(model_id: int, user_id: int) -> AIModel:
         """验证 AI 模型"""
-        try:
-            model = AIModel.objects.select_related('endpoint').get(
-                id=model_id,
-                endpoint__owner_id=user_id
-            )
-        except AIModel.DoesNotExist:
+        model = AIModel.objects.select_related('endpoint').filter(
+            id=model_id,
+            endpoint__owner_id=user_id
+        ).first()
+        if model is None:
             raise ModelNotFoundError(f"模型不存在或无权访问: model_id={model_id}")
 
         return model
@@ -315,16 +366,61 @@ class AnalysisService:
         Raises:
             FileReadError: 文件读取失败
         """
+        mime_type = media.mime_type or 'image/jpeg'
+
         try:
             with media.file.open('rb') as img_file:
-                image_data = base64.b64encode(img_file.read()).decode('utf-8')
+                content = img_file.read()
         except Exception as e:
-            logger.error(f"读取图片文件失败: media_id={media.id}, error={str(e)}")
+            logger.error("读取图片文件失败: media_id=%s, error=%s", media.id, e)
             raise FileReadError(f"读取图片文件失败: {str(e)}")
 
-        mime_type = media.mime_type or 'image/jpeg'
+        # 大图先缩小再编码，减少传输数据量和模型的图片 Token
+        max_edge = ANALYSIS_DEFAULTS.IMAGE_MAX_EDGE
+        if max(media.width or 0, media.height or 0) > max_edge:
+            resized = AnalysisService._downscale_image(content, max_edge)
+            if resized is not None:
+                content, mime_type = resized, 'image/jpeg'
+
+        image_data = base64.b64encode(content).decode('ascii')
         return image_data, mime_type
 
+    @staticmethod
+    def _downscale_image(content: bytes, max_edge: int) -> Optional[bytes]:
+        """
+        等比缩小图片并重新编码为 JPEG
+
+        先按 EXIF 方向信息旋转图片，透明区域以白色背景填充
+
+        Args:
+            content: 原始图片数据
+            max_edge: 最长边（像素）
+
+        Returns:
+            bytes | None: 缩小后的 JPEG 数据，无法处理时返回 None（使用原图）
+        """
+        try:
+            with Image.open(BytesIO(content)) as img:
+                # 重新编码会丢弃 EXIF，先按方向信息旋转，避免竖拍照片发给模型时是横向的
+                img = ImageOps.exif_transpose(img)
+
+                if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info):
+                    # JPEG 不支持透明通道，直接转 RGB 会使透明区域变黑
+                    rgba = img.convert('RGBA')
+                    img = Image.new('RGB', rgba.size, (255, 255, 255))
+                    img.paste(rgba, mask=rgba.getchannel('A'))
+                elif img.mode != 'RGB':
+                    img = img.convert('RGB')
+
+                img.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+
+                output = BytesIO()
+                img.save(output, format='JPEG', quality=ANALYSIS_DEFAULTS.IMAGE_JPEG_QUALITY)
+                return output.getvalue()
+        except Exception as e:
+            logger.warning("图片缩放失败，使用原图: error=%s", e)
+            return None
+
     @staticmethod
     def _save_success(analysis: ImageAnalysis, result) -> None:
         """
@@ -334,8 +430,6 @@ class AnalysisService:
             analysis: 分析记录
             result: AnalysisResult 实例
         """
-        from django.db import transaction
-
         with transaction.atomic():
             analysis.description = result.description
             analysis.method = result.method
@@ -393,7 +487,7 @@ class AnalysisService:
         # 发送统计更新
         send_stats_update(analysis.user_id, AnalysisService.get_stats(analysis.user_id))
 
-        logger.error(f"分析失败: analysis_id={analysis.id}, error={str(exc)}")
+        logger.error("分析失败: analysis_id=%s, error=%s", analysis.id, exc)
 
     @staticmethod
     def _sync_category(media, category_name: str) -> None:
@@ -404,8 +498,6 @@ class AnalysisService:
             media: Media 实例
             category_name: 分类名称
         """
-        from media.models import Category
-
         if not category_name or not category_name.strip():
             return
 
@@ -418,6 +510,6 @@ class AnalysisService:
             )
             media.category = category
             media.save(update_fields=['category', 'updated_at'])
-            logger.info(f"媒体 {media.id} 已设置分类: {category_name}")
+            logger.info("媒体 %s 已设置分类: %s", media.id, category_name)
         except Exception as e:
-            logger.warning(f"同步分类失败: media_id={media.id}, error={str(e)}")
+            logger.warning("同步分类失败: media_id=%s, error=%s", media.id, e)
@@ -4,10 +4,42 @@ AI 提供商抽象基类
 定义所有 AI 提供商必须实现的接口
 """
 
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from http.cookiejar import DefaultCookiePolicy
 from typing import List, Dict, Any, Optional
 
+import requests
+from requests.adapters import HTTPAdapter
+
+# 连接池大小（每个主机保持的最大连接数）
+HTTP_POOL_MAXSIZE = 20
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """
+    获取进程内共享的 HTTP 会话
+
+    复用 keep-alive 连接，避免每次调用 AI 接口都重新建立 TCP/TLS 连接。
+    会话由所有用户的端点和线程共用，因此禁止保存 Cookie，只复用连接池
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                # 允许域名列表为空：不保存任何 Set-Cookie，也不发送 Cookie
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                adapter = HTTPAdapter(pool_connections=10, pool_maxsize=HTTP_POOL_MAXSIZE)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                _session = session
+    return _session
+
 
 @dataclass
 class AnalysisResult:
@@ -11,7 +11,7 @@ import re
 import requests
 from typing import List
 
-from .base import BaseProvider, AnalysisResult
+from .base import BaseProvider, AnalysisResult, get_http_session
 from llm.constants import PROMPTS, ANALYSIS_DEFAULTS
 from llm.exceptions import (
     NetworkError,
@@ -24,6 +24,9 @@ from llm.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# 匹配 markdown 代码块中的 JSON 对象
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+
 
 class OllamaProvider(BaseProvider):
     """
@@ -57,6 +60,8 @@ class OllamaProvider(BaseProvider):
                 }
             ],
             'stream': False,
+            # 约束模型直接输出 JSON，减少解析失败和多余的解释性文本
+            'format': 'json',
             'options': {
                 'temperature': ANALYSIS_DEFAULTS.TEMPERATURE,
                 'num_predict': ANALYSIS_DEFAULTS.NUM_PREDICT,
@@ -64,8 +69,8 @@ class OllamaProvider(BaseProvider):
         }
 
         try:
-            logger.info(f"Ollama API 请求: url={api_url}, model={self.model.name}")
-            response = requests.post(api_url, headers=headers, json=payload, timeout=timeout)
+            logger.debug("Ollama API 请求: url=%s, model=%s", api_url, self.model.name)
+            response = get_http_session().post(api_url, headers=headers, json=payload, timeout=timeout)
             response.raise_for_status()
 
             data = response.json()
@@ -115,7 +120,7 @@ class OllamaProvider(BaseProvider):
         timeout = self._get_timeout()
 
         try:
-            response = requests.get(api_url, headers=headers, timeout=timeout)
+            response = get_http_session().get(api_url, headers=headers, timeout=timeout)
             response.raise_for_status()
 
             data = response.json()
@@ -146,7 +151,7 @@ class OllamaProvider(BaseProvider):
             pass
 
         # 尝试从 markdown 代码块中提取
-        json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL)
+        json_match = _JSON_BLOCK_RE.search(content)
         if json_match:
             try:
                 return json.loads(json_match.group(1))
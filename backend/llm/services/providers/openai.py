@@ -7,10 +7,11 @@ OpenAI 兼容提供商实现
 import json
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 import requests
 from typing import List
 
-from .base import BaseProvider, AnalysisResult
+from .base import BaseProvider, AnalysisResult, get_http_session
 from llm.constants import PROMPTS, ANALYSIS_DEFAULTS
 from llm.exceptions import (
     NetworkError,
@@ -23,6 +24,12 @@ from llm.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# 匹配 markdown 代码块中的 JSON 对象
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+
+# 标签分隔符：顿号、中英文逗号、换行
+_TAG_SPLIT_RE = re.compile(r'[,，、\n]')
+
 
 class OpenAICompatibleProvider(BaseProvider):
     """
@@ -33,7 +40,7 @@ class OpenAICompatibleProvider(BaseProvider):
 
     分析策略:
     1. 优先尝试单次请求获取完整 JSON 结果
-    2. 如果失败，降级为三次请求（描述、分类、场景）
+    2. 如果失败，降级为三次请求（先获取描述，再并发提取分类和场景）
     """
 
     def analyze(self, image_data: str, mime_type: str) -> AnalysisResult:
@@ -49,27 +56,29 @@ class OpenAICompatibleProvider(BaseProvider):
         """
         api_url = f"{self.endpoint.base_url.rstrip('/')}/chat/completions"
         headers = self._build_headers()
+        # 图片 data URL 只构建一次，供单次请求和降级请求共用
+        image_url = f"data:{mime_type};base64,{image_data}"
 
         # 方案一：尝试单次请求
-        logger.info(f"OpenAI API 单次请求: model={self.model.name}")
+        logger.debug("OpenAI API 单次请求: model=%s", self.model.name)
         try:
-            result = self._single_request(api_url, headers, image_data, mime_type)
+            result = self._single_request(api_url, headers, image_url)
             if result:
                 return result
         except (ValidationError, APIError) as e:
             # 可恢复的错误，降级为三次请求
-            logger.warning(f"单次请求失败，降级为三次请求: {e}")
+            logger.warning("单次请求失败，降级为三次请求: %s", e)
         except (NetworkError, TimeoutError, RateLimitError, PermissionError):
             # 不可恢复的错误，直接抛出
             raise
         except Exception as e:
             # 未知错误，记录后抛出
-            logger.error(f"单次请求发生未知错误: {type(e).__name__}: {e}")
+            logger.error("单次请求发生未知错误: %s: %s", type(e).__name__, e)
             raise APIError(f"分析请求失败: {e}")
 
         # 方案二：降级为三次请求
-        logger.info(f"OpenAI API 降级为三次请求: model={self.model.name}")
-        return self._three_requests(api_url, headers, image_data, mime_type)
+        logger.info("OpenAI API 降级为三次请求: model=%s", self.model.name)
+        return self._three_requests(api_url, headers, image_url)
 
     def get_available_models(self) -> List[str]:
         """
@@ -83,7 +92,7 @@ class OpenAICompatibleProvider(BaseProvider):
         timeout = self._get_timeout()
 
         try:
-            response = requests.get(api_url, headers=headers, timeout=timeout)
+            response = get_http_session().get(api_url, headers=headers, timeout=timeout)
             response.raise_for_status()
 
             data = response.json()
@@ -101,8 +110,7 @@ class OpenAICompatibleProvider(BaseProvider):
         self,
         api_url: str,
         headers: dict,
-        image_data: str,
-        mime_type: str
+        image_url: str
     ) -> AnalysisResult:
         """
         单次请求获取完整分析（JSON 格式）
@@ -110,8 +118,7 @@ class OpenAICompatibleProvider(BaseProvider):
         Args:
             api_url: API URL
             headers: 请求头
-            image_data: Base64 图片数据
-            mime_type: MIME 类型
+            image_url: 图片 data URL
 
         Returns:
             AnalysisResult: 分析结果
@@ -128,7 +135,7 @@ class OpenAICompatibleProvider(BaseProvider):
                         {
                             'type': 'image_url',
                             'image_url': {
-                                'url': f"data:{mime_type};base64,{image_data}"
+                                'url': image_url
                             }
                         }
                     ]
@@ -137,7 +144,7 @@ class OpenAICompatibleProvider(BaseProvider):
             'max_tokens': ANALYSIS_DEFAULTS.MAX_TOKENS_SINGLE,
         }
 
-        response = requests.post(api_url, headers=headers, json=payload, timeout=timeout)
+        response = get_http_session().post(api_url, headers=headers, json=payload, timeout=timeout)
         response.raise_for_status()
 
         data = response.json()
@@ -167,8 +174,7 @@ class OpenAICompatibleProvider(BaseProvider):
         self,
         api_url: str,
         headers: dict,
-        image_data: str,
-        mime_type: str
+        image_url: str
     ) -> AnalysisResult:
         """
         三次请求分别获取描述、分类、场景
@@ -176,8 +182,7 @@ class OpenAICompatibleProvider(BaseProvider):
         Args:
             api_url: API URL
             headers: 请求头
-            image_data: Base64 图片数据
-            mime_type: MIME 类型
+            image_url: 图片 data URL
 
         Returns:
             AnalysisResult: 分析结果
@@ -196,7 +201,7 @@ class OpenAICompatibleProvider(BaseProvider):
                         {
                             'type': 'image_url',
                             'image_url': {
-                                'url': f"data:{mime_type};base64,{image_data}"
+                                'url': image_url
                             }
                         }
                     ]
@@ -205,62 +210,69 @@ class OpenAICompatibleProvider(BaseProvider):
             'max_tokens': ANALYSIS_DEFAULTS.MAX_TOKENS_DESCRIPTION,
         }
 
-        desc_response = requests.post(api_url, headers=headers, json=desc_payload, timeout=timeout)
+        desc_response = get_http_session().post(api_url, headers=headers, json=desc_payload, timeout=timeout)
         desc_response.raise_for_status()
         desc_data = desc_response.json()
         description = desc_data['choices'][0].get('message', {}).get('content', '')
         total_tokens += desc_data.get('usage', {}).get('total_tokens', 0)
 
-        # 第二次请求：提取分类
-        cat_payload = {
-            'model': self.model.name,
-            'messages': [
-                {
-                    'role': 'user',
-                    'content': [
-                        {'type': 'text', 'text': PROMPTS.CATEGORIES_FROM_DESC.format(description=description)},
-                    ]
-                }
-            ],
-            'max_tokens': ANALYSIS_DEFAULTS.MAX_TOKENS_TAGS,
-        }
+        # 第二、三次请求：基于描述提取分类和场景，两者互不依赖，并发执行
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            cat_future = executor.submit(
+                self._text_request, api_url, headers,
+                PROMPTS.CATEGORIES_FROM_DESC.format(description=description), timeout
+            )
+            scene_future = executor.submit(
+                self._text_request, api_url, headers,
+                PROMPTS.SCENES_FROM_DESC.format(description=description), timeout
+            )
+            cat_content, cat_tokens = cat_future.result()
+            scene_content, scene_tokens = scene_future.result()
 
-        cat_response = requests.post(api_url, headers=headers, json=cat_payload, timeout=timeout)
-        cat_response.raise_for_status()
-        cat_data = cat_response.json()
-        cat_content = cat_data['choices'][0].get('message', {}).get('content', '')
         categories = self._parse_tags(cat_content)
-        total_tokens += cat_data.get('usage', {}).get('total_tokens', 0)
+        scenes = self._parse_tags(scene_content)
+        total_tokens += cat_tokens + scene_tokens
+
+        return AnalysisResult(
+            description=description,
+            categories=categories,
+            scenes=scenes,
+            raw_response=f"描述: {description}\n分类: {categories}\n场景: {scenes}",
+            method='three_requests',
+            tokens_used=total_tokens,
+        )
 
-        # 第三次请求：提取场景
-        scene_payload = {
+    def _text_request(self, api_url: str, headers: dict, prompt: str, timeout: int) -> tuple[str, int]:
+        """
+        纯文本请求（用于从描述中提取标签）
+
+        Args:
+            api_url: API URL
+            headers: 请求头
+            prompt: 提示词
+            timeout: 超时秒数
+
+        Returns:
+            tuple[str, int]: (响应内容, Token 使用量)
+        """
+        payload = {
             'model': self.model.name,
             'messages': [
                 {
                     'role': 'user',
                     'content': [
-                        {'type': 'text', 'text': PROMPTS.SCENES_FROM_DESC.format(description=description)},
+                        {'type': 'text', 'text': prompt},
                     ]
                 }
             ],
             'max_tokens': ANALYSIS_DEFAULTS.MAX_TOKENS_TAGS,
         }
 
-        scene_response = requests.post(api_url, headers=headers, json=scene_payload, timeout=timeout)
-        scene_response.raise_for_status()
-        scene_data = scene_response.json()
-        scene_content = scene_data['choices'][0].get('message', {}).get('content', '')
-        scenes = self._parse_tags(scene_content)
-        total_tokens += scene_data.get('usage', {}).get('total_tokens', 0)
-
-        return AnalysisResult(
-            description=description,
-            categories=categories,
-            scenes=scenes,
-            raw_response=f"描述: {description}\n分类: {categories}\n场景: {scenes}",
-            method='three_requests',
-            tokens_used=total_tokens,
-        )
+        response = get_http_session().post(api_url, headers=headers, json=payload, timeout=timeout)
+        response.raise_for_status()
+        data = response.json()
+        content = data['choices'][0].get('message', {}).get('content', '')
+        return content, data.get('usage', {}).get('total_tokens', 0)
 
     def _parse_json_response(self, content: str) -> dict:
         """解析 JSON 响应"""
@@ -270,7 +282,7 @@ class OpenAICompatibleProvider(BaseProvider):
             pass
 
         # 尝试从 markdown 代码块提取
-        json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL)
+        json_match = _JSON_BLOCK_RE.search(content)
         if json_match:
             try:
                 return json.loads(json_match.group(1))
@@ -281,8 +293,8 @@ class OpenAICompatibleProvider(BaseProvider):
 
     def _parse_tags(self, content: str) -> List[str]:
         """解析标签列表"""
-        # 支持顿号和逗号分隔
-        tags = [tag.strip() for tag in content.replace('、', ',').split(',') if tag.strip()]
+        # 支持顿号、中英文逗号和换行分隔，一次切分
+        tags = [tag for tag in (item.strip() for item in _TAG_SPLIT_RE.split(content)) if tag]
         return tags[:ANALYSIS_DEFAULTS.MAX_CATEGORIES]
 
     def _handle_http_error(self, e: requests.exceptions.HTTPError):
@@ -47,14 +47,14 @@ def analyze_image_task(media_id: int, model_id: int, user_id: int) -> int:
         # 执行分析
         AnalysisService.execute_analysis(analysis.id)
 
-        logger.info(f"图片分析任务完成: analysis_id={analysis.id}")
+        logger.info("图片分析任务完成: analysis_id=%s", analysis.id)
         return analysis.id
 
     except LLMException as e:
-        logger.error(f"图片分析任务失败: {e.message}")
+        logger.error("图片分析任务失败: %s", e.message)
         raise
     except Exception as e:
-        logger.error(f"图片分析任务失败: {str(e)}")
+        logger.error("图片分析任务失败: %s", e)
         raise
 
 
@@ -75,14 +75,14 @@ def execute_analysis_task(analysis_id: int) -> int:
 
     try:
         AnalysisService.execute_analysis(analysis_id)
-        logger.info(f"执行分析任务完成: analysis_id={analysis_id}")
+        logger.info("执行分析任务完成: analysis_id=%s", analysis_id)
         return analysis_id
 
     except LLMException as e:
-        logger.error(f"执行分析任务失败: {e.message}")
+        logger.error("执行分析任务失败: %s", e.message)
         raise
     except Exception as e:
-        logger.error(f"执行分析任务失败: {str(e)}")
+        logger.error("执行分析任务失败: %s", e)
         raise
 
 
@@ -103,23 +103,27 @@ def retry_analysis_task(analysis_id: int) -> int:
 
     try:
         # 获取分析记录以获取 user_id
-        from llm.models import ImageAnalysis
+        from llm.models import ImageAnalysis, AnalysisStatus
         analysis = ImageAnalysis.objects.get(id=analysis_id)
 
+        # 入队后已被取消的记录不再重置和执行
+        if analysis.status == AnalysisStatus.CANCELLED:
+            return analysis_id
+
         # 使用服务层重置状态
         AnalysisService.retry_analysis(analysis_id, analysis.user_id)
 
         # 执行分析
         AnalysisService.execute_analysis(analysis_id)
 
-        logger.info(f"重试分析任务完成: analysis_id={analysis_id}")
+        logger.info("重试分析任务完成: analysis_id=%s", analysis_id)
         return analysis_id
 
     except LLMException as e:
-        logger.error(f"重试分析任务失败: {e.message}")
+        logger.error("重试分析任务失败: %s", e.message)
         raise
     except Exception as e:
-        logger.error(f"重试分析任务失败: {str(e)}")
+        logger.error("重试分析任务失败: %s", e)
         raise
 
 
@@ -139,12 +143,12 @@ def sync_models_task(endpoint_id: int, user_id: int) -> Dict[str, Any]:
 
     try:
         result = SyncService.sync_models(endpoint_id, user_id)
-        logger.info(f"模型同步任务完成: endpoint_id={endpoint_id}")
+        logger.info("模型同步任务完成: endpoint_id=%s", endpoint_id)
         return result
 
     except LLMException as e:
-        logger.error(f"模型同步任务失败: {e.message}")
+        logger.error("模型同步任务失败: %s", e.message)
         raise
     except Exception as e:
-        logger.error(f"模型同步任务失败: endpoint_id={endpoint_id}, error={str(e)}")
+        logger.error("模型同步任务失败: endpoint_id=%s, error=%s", endpoint_id, e)
         raise
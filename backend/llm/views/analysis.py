@@ -19,6 +19,7 @@ API 端点:
 
 import logging
 from django.utils import timezone
+from django.db import transaction
 from django.db.models import F
 from rest_framework import viewsets, filters
 from rest_framework.decorators import action
@@ -33,11 +34,11 @@ from utils.responses import (
     NoContentResponse,
     BadRequestResponse,
     NotFoundResponse,
-    ErrorResponse,
 )
+from utils.pagination import StandardCursorPagination
+from utils.viewsets import SerializerActionMixin
 from llm.models import (
     Endpoint,
-    AIModel,
     ImageAnalysis,
     AnalysisStatus,
 )
@@ -49,7 +50,7 @@ from llm.serializers import (
     BatchAnalysisActionSerializer,
     SyncModelsSerializer,
 )
-from llm.services import AnalysisService, SyncService
+from llm.services import AnalysisService
 from llm.tasks import (
     execute_analysis_task,
     retry_analysis_task,
@@ -63,31 +64,35 @@ from llm.exceptions import (
 logger = logging.getLogger(__name__)
 
 
-class AnalysisViewSet(viewsets.ModelViewSet):
+class AnalysisViewSet(SerializerActionMixin, viewsets.ModelViewSet):
     """
     分析视图集
 
     合并原 TaskViewSet 和 ImageAnalysisViewSet 的功能
     """
 
+    serializer_class = ImageAnalysisSerializer
+    serializer_action_classes = {
+        'create': CreateAnalysisSerializer,
+    }
     permission_classes = [IsAuthenticated]
+    pagination_class = StandardCursorPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['status', 'media', 'model', 'error_type']
     search_fields = ['description', 'error_message']
     ordering_fields = ['created_at', 'completed_at', 'retry_count']
-    ordering = ['-created_at']
+    ordering = ['-created_at', '-id']
+
+    # 只修改状态、不做完整序列化的操作，无需关联查询
+    _NO_JOIN_ACTIONS = frozenset({'retry', 'cancel', 'update_description', 'destroy'})
 
     def get_queryset(self):
         """只返回当前用户的分析记录"""
-        return ImageAnalysis.objects.filter(
-            user=self.request.user
-        ).select_related('media', 'model', 'endpoint')
-
-    def get_serializer_class(self):
-        """根据操作类型选择序列化器"""
-        if self.action == 'create':
-            return CreateAnalysisSerializer
-        return ImageAnalysisSerializer
+        queryset = ImageAnalysis.objects.filter(user=self.request.user)
+        if self.action in self._NO_JOIN_ACTIONS:
+            return queryset
+        # 序列化时会读取 media.category，一并关联查询避免 N+1
+        return queryset.select_related('media__category', 'model', 'endpoint')
 
     def create(self, request):
         """
@@ -121,7 +126,7 @@ class AnalysisViewSet(viewsets.ModelViewSet):
             save=True
         )
 
-        logger.info(f"分析任务已创建: analysis_id={analysis.id}")
+        logger.info("分析任务已创建: analysis_id=%s", analysis.id)
 
         return CreatedResponse({
             'analysis_id': analysis.id,
@@ -129,8 +134,20 @@ class AnalysisViewSet(viewsets.ModelViewSet):
         })
 
     def list(self, request):
-        """列表"""
+        """
+        列表
+
+        默认返回全部记录；传入 cursor 或 page_size 参数时使用游标分页，
+        此时固定按 (-created_at, -id) 排序，忽略 ordering 参数
+        """
         queryset = self.filter_queryset(self.get_queryset())
+
+        params = request.query_params
+        if 'cursor' in params or 'page_size' in params:
+            page = self.paginate_queryset(queryset)
+            serializer = self.get_serializer(page, many=True)
+            return self.paginator.get_paginated_response(serializer.data)
+
         serializer = self.get_serializer(queryset, many=True)
         return SuccessResponse(serializer.data)
 
@@ -161,30 +178,24 @@ class AnalysisViewSet(viewsets.ModelViewSet):
         model_id = serializer.validated_data['model_id']
         group = f"batch_{request.user.id}_{model_id}"
 
-        created_ids = []
-        skipped_count = 0
-
-        for media_id in media_ids:
-            try:
-                analysis = AnalysisService.create_analysis(
-                    media_id=media_id,
-                    model_id=model_id,
-                    user_id=request.user.id
-                )
-                created_ids.append(analysis.id)
+        analyses, skipped_count = AnalysisService.create_batch_analyses(
+            media_ids=media_ids,
+            model_id=model_id,
+            user_id=request.user.id
+        )
+        created_ids = [analysis.id for analysis in analyses]
 
-                # 创建异步任务
+        # ORM broker 下每次入队都是一次 INSERT，合并到同一事务中只提交一次
+        with transaction.atomic():
+            for analysis_id in created_ids:
                 async_task(
                     execute_analysis_task,
-                    analysis.id,
+                    analysis_id,
                     group=group,
                     save=True
                 )
-            except LLMException:
-                skipped_count += 1
-                continue
 
-        logger.info(f"批量任务已创建: count={len(created_ids)}, skipped={skipped_count}")
+        logger.info("批量任务已创建: count=%s, skipped=%s", len(created_ids), skipped_count)
 
         return CreatedResponse({
             'group': group,
@@ -223,12 +234,15 @@ class AnalysisViewSet(viewsets.ModelViewSet):
         instance.last_retry_at = timezone.now()
         instance.error_message = ''
         instance.error_details = {}
-        instance.save()
+        instance.save(update_fields=[
+            'status', 'retry_count', 'last_retry_at',
+            'error_message', 'error_details', 'updated_at',
+        ])
 
         # 创建重试任务
         async_task(retry_analysis_task, instance.id, save=True)
 
-        logger.info(f"重试任务已创建: analysis_id={instance.id}")
+        logger.info("重试任务已创建: analysis_id=%s", instance.id)
 
         return CreatedResponse({
             'retry_count': instance.retry_count,
@@ -249,7 +263,7 @@ class AnalysisViewSet(viewsets.ModelViewSet):
 
         instance.status = AnalysisStatus.CANCELLED
         instance.error_message = '用户取消'
-        instance.save()
+        instance.save(update_fields=['status', 'error_message', 'updated_at'])
 
         return SuccessResponse({'message': '任务已取消'})
 
@@ -261,8 +275,6 @@ class AnalysisViewSet(viewsets.ModelViewSet):
         POST /api/llm/analyses/batch_retry/
         Body: { "analysis_ids": [1, 2, 3] }  # 可选，为空则重试所有失败的任务
         """
-        from django.db import transaction
-
         serializer = BatchAnalysisActionSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
@@ -296,19 +308,22 @@ class AnalysisViewSet(viewsets.ModelViewSet):
                 'message': '没有可重试的任务'
             })
 
-        # 批量更新
+        # 状态更新与任务入队在同一事务中提交
         now = timezone.now()
-        updated_count = ImageAnalysis.objects.filter(id__in=retryable_ids).update(
-            status=AnalysisStatus.PENDING,
-            retry_count=F('retry_count') + 1,
-            last_retry_at=now,
-            error_message='',
-            error_details={}
-        )
+        with transaction.atomic():
+            updated_count = ImageAnalysis.objects.filter(id__in=retryable_ids).update(
+                status=AnalysisStatus.PENDING,
+                retry_count=F('retry_count') + 1,
+                last_retry_at=now,
+                error_message='',
+                error_details={}
+            )
+
+            # 批量创建重试任务
+            for analysis_id in retryable_ids:
+                async_task(retry_analysis_task, analysis_id, save=True)
 
-        # 批量创建重试任务
-        for analysis_id in retryable_ids:
-            async_task(retry_analysis_task, analysis_id, save=True)
+        logger.info("批量重试任务已创建: count=%s", updated_count)
 
         return CreatedResponse({
             'retried': updated_count,
@@ -322,17 +337,21 @@ class AnalysisViewSet(viewsets.ModelViewSet):
         批量取消分析
 
         POST /api/llm/analyses/batch_cancel/
-        Body: { "analysis_ids": [1, 2, 3] }
+        Body: { "analysis_ids": [1, 2, 3] }  # 可选，省略时取消所有进行中的任务，空列表不取消任何任务
         """
         serializer = BatchAnalysisActionSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        analysis_ids = serializer.validated_data['analysis_ids']
+        analysis_ids = serializer.validated_data.get('analysis_ids')
 
-        cancelled_count = self.get_queryset().filter(
-            id__in=analysis_ids,
+        queryset = self.get_queryset().filter(
             status__in=[AnalysisStatus.PENDING, AnalysisStatus.PROCESSING]
-        ).update(
+        )
+        if analysis_ids is not None:
+            queryset = queryset.filter(id__in=analysis_ids)
+
+        # 单条 UPDATE 完成取消，队列中的任务执行时会跳过已取消的记录
+        cancelled_count = queryset.update(
             status=AnalysisStatus.CANCELLED,
             error_message='用户批量取消'
         )
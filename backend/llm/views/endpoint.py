@@ -16,6 +16,7 @@ from utils.responses import (
     CreatedResponse,
     NoContentResponse,
 )
+from utils.viewsets import SerializerActionMixin
 from llm.models import Endpoint
 from llm.serializers import EndpointSerializer, EndpointCreateSerializer
 from llm.services.providers import get_provider_for_endpoint
@@ -24,7 +25,7 @@ from llm.exceptions import NetworkError, TimeoutError, APIError
 logger = logging.getLogger(__name__)
 
 
-class EndpointViewSet(viewsets.ModelViewSet):
+class EndpointViewSet(SerializerActionMixin, viewsets.ModelViewSet):
     """
     API 端点视图集
 
@@ -37,6 +38,10 @@ class EndpointViewSet(viewsets.ModelViewSet):
     - DELETE /api/llm/endpoints/{id}/      # 删除
     """
 
+    serializer_class = EndpointSerializer
+    serializer_action_classes = {
+        'create': EndpointCreateSerializer,
+    }
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['name', 'base_url']
@@ -47,12 +52,6 @@ class EndpointViewSet(viewsets.ModelViewSet):
         """只返回当前用户的端点"""
         return Endpoint.objects.filter(owner=self.request.user).select_related('owner')
 
-    def get_serializer_class(self):
-        """根据操作类型选择序列化器"""
-        if self.action == 'create':
-            return EndpointCreateSerializer
-        return EndpointSerializer
-
     def perform_create(self, serializer):
         """创建时自动设置所有者"""
         serializer.save(owner=self.request.user)
@@ -16,6 +16,7 @@ from utils.responses import (
     NoContentResponse,
     ErrorResponse,
 )
+from utils.viewsets import SerializerActionMixin
 from llm.models import Endpoint, AIModel
 from llm.serializers import (
     AIModelSerializer,
@@ -26,7 +27,7 @@ from llm.serializers import (
 logger = logging.getLogger(__name__)
 
 
-class AIModelViewSet(viewsets.ModelViewSet):
+class AIModelViewSet(SerializerActionMixin, viewsets.ModelViewSet):
     """
     AI 模型视图集
 
@@ -40,6 +41,12 @@ class AIModelViewSet(viewsets.ModelViewSet):
     - POST   /api/llm/models/{id}/set_default/  # 设置/取消默认
     """
 
+    serializer_class = AIModelSerializer
+    serializer_action_classes = {
+        'create': AIModelCreateSerializer,
+        'update': AIModelUpdateSerializer,
+        'partial_update': AIModelUpdateSerializer,
+    }
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['endpoint']
@@ -52,14 +59,6 @@ class AIModelViewSet(viewsets.ModelViewSet):
         user_endpoints = Endpoint.objects.filter(owner=self.request.user)
         return AIModel.objects.filter(endpoint__in=user_endpoints).select_related('endpoint')
 
-    def get_serializer_class(self):
-        """根据操作类型选择序列化器"""
-        if self.action == 'create':
-            return AIModelCreateSerializer
-        if self.action in ['update', 'partial_update']:
-            return AIModelUpdateSerializer
-        return AIModelSerializer
-
     def list(self, request, *args, **kwargs):
         """列表"""
         queryset = self.filter_queryset(self.get_queryset())
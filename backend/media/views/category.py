@@ -39,6 +39,9 @@ class CategoryViewSet(BaseModelViewSet):
     """
 
     serializer_class = CategorySerializer
+    serializer_action_classes = {
+        'create': CategoryCreateSerializer,
+    }
     permission_classes = [IsAuthenticated]
     pagination_class = StandardPagination
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
@@ -50,12 +53,6 @@ class CategoryViewSet(BaseModelViewSet):
         """返回所有分类（全局共享）"""
         return Category.objects.all()
 
-    def get_serializer_class(self):
-        """根据操作类型选择序列化器"""
-        if self.action == 'create':
-            return CategoryCreateSerializer
-        return CategorySerializer
-
     def create(self, request, *args, **kwargs):
         """创建分类"""
         serializer = self.get_serializer(data=request.data)
@@ -48,6 +48,12 @@ class MediaViewSet(BaseModelViewSet):
     - POST   /api/media/batch_delete/  # 批量删除
     """
 
+    serializer_class = MediaSerializer
+    serializer_action_classes = {
+        'create': MediaCreateSerializer,
+        'update': MediaUpdateSerializer,
+        'partial_update': MediaUpdateSerializer,
+    }
     permission_classes = [IsAuthenticated]
     pagination_class = StandardPagination
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
@@ -70,14 +76,6 @@ class MediaViewSet(BaseModelViewSet):
 
         return queryset
 
-    def get_serializer_class(self):
-        """根据操作类型选择序列化器"""
-        if self.action == 'create':
-            return MediaCreateSerializer
-        elif self.action in ['update', 'partial_update']:
-            return MediaUpdateSerializer
-        return MediaSerializer
-
     def perform_create(self, serializer):
         """创建时自动设置所有者"""
         serializer.save(owner=self.request.user)
@@ -53,6 +53,12 @@ class ProjectViewSet(BaseModelViewSet):
     - GET    /api/projects/available_media/    # 获取可添加的媒体
     """
 
+    serializer_class = ProjectSerializer
+    serializer_action_classes = {
+        'create': ProjectCreateSerializer,
+        'update': ProjectUpdateSerializer,
+        'partial_update': ProjectUpdateSerializer,
+    }
     permission_classes = [IsAuthenticated]
     pagination_class = StandardPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
@@ -64,14 +70,6 @@ class ProjectViewSet(BaseModelViewSet):
         """只返回当前用户的项目"""
         return Project.objects.filter(owner=self.request.user).prefetch_related('project_media')
 
-    def get_serializer_class(self):
-        """根据操作类型选择序列化器"""
-        if self.action == 'create':
-            return ProjectCreateSerializer
-        elif self.action in ['update', 'partial_update']:
-            return ProjectUpdateSerializer
-        return ProjectSerializer
-
     def perform_create(self, serializer):
         """创建时自动设置所有者"""
         serializer.save(owner=self.request.user)
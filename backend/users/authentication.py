@@ -0,0 +1,34 @@
+"""
+用户认证
+
+提供带用户缓存的 JWT 认证类
+"""
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+from .cache import get_cached_user, cache_user
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    带用户缓存的 JWT 认证
+
+    命中缓存时仍校验账户是否启用，未命中时沿用 simplejwt 的查询和校验逻辑并写入缓存。
+    用户保存或删除时由 users.signals 失效缓存。
+    """
+
+    def get_user(self, validated_token):
+        """根据 token 获取用户，优先读取缓存"""
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is not None:
+            user = get_cached_user(user_id)
+            if user is not None:
+                if not user.is_active:
+                    raise AuthenticationFailed('账户已被禁用', code='user_inactive')
+                return user
+
+        user = super().get_user(validated_token)
+        cache_user(user)
+        return user
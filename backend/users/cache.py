@@ -0,0 +1,97 @@
+"""
+用户缓存
+
+- 缓存 JWT 认证得到的用户对象，避免每个已认证请求都按主键查询用户表
+- 短期缓存登录时的密码校验结果，避免短时间内重复登录反复执行密码哈希
+"""
+
+from django.core.cache import cache, caches
+from django.utils.crypto import salted_hmac
+
+# 用户对象缓存时间（秒）
+# 信号只能失效当前进程可见的缓存，QuerySet.update 等绕过信号的修改也无法失效，
+# 因此只缓存几秒，把其他进程中的禁用、改密等变更的可见延迟控制在秒级
+USER_CACHE_TIMEOUT = 10
+
+# 登录密码校验结果缓存时间（秒）
+LOGIN_CACHE_TIMEOUT = 60
+
+# 登录密码校验结果使用独立的进程内缓存（见 settings.CACHES['login']），
+# 缓存值是密码哈希，不能随默认缓存落盘或共享到外部
+LOGIN_CACHE_ALIAS = 'login'
+
+
+def _user_cache_key(user_id) -> str:
+    """用户对象缓存键"""
+    return f'users:user:{user_id}'
+
+
+def get_cached_user(user_id):
+    """
+    获取缓存的用户对象
+
+    Args:
+        user_id: 用户 ID
+
+    Returns:
+        User | None: 命中时返回用户对象，否则返回 None
+    """
+    return cache.get(_user_cache_key(user_id))
+
+
+def cache_user(user) -> None:
+    """
+    缓存用户对象
+
+    Args:
+        user: 用户对象
+    """
+    cache.set(_user_cache_key(user.pk), user, USER_CACHE_TIMEOUT)
+
+
+def invalidate_user_cache(user_id) -> None:
+    """
+    失效用户对象缓存
+
+    Args:
+        user_id: 用户 ID
+    """
+    cache.delete(_user_cache_key(user_id))
+
+
+def _login_cache_key(email: str, password: str) -> str:
+    """
+    登录校验缓存键
+
+    使用 SECRET_KEY 做 HMAC，缓存中不会出现明文密码
+    """
+    digest = salted_hmac('users.login', f'{email}:{password}', algorithm='sha256').hexdigest()
+    return f'users:login:{digest}'
+
+
+def get_verified_password_hash(email: str, password: str):
+    """
+    获取已校验通过的密码哈希
+
+    Args:
+        email: 邮箱
+        password: 明文密码
+
+    Returns:
+        str | None: 最近校验通过时用户的密码哈希，未命中返回 None
+    """
+    return caches[LOGIN_CACHE_ALIAS].get(_login_cache_key(email, password))
+
+
+def cache_verified_password(email: str, password: str, password_hash: str) -> None:
+    """
+    缓存校验通过的密码
+
+    只缓存成功的校验；以密码哈希作为值，用户修改密码后缓存自然失效
+
+    Args:
+        email: 邮箱
+        password: 明文密码
+        password_hash: 用户当前的密码哈希
+    """
+    caches[LOGIN_CACHE_ALIAS].set(_login_cache_key(email, password), password_hash, LOGIN_CACHE_TIMEOUT)
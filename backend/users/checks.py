@@ -0,0 +1,20 @@
+"""
+用户模块系统检查
+"""
+
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+
+@register(Tags.security, deploy=True)
+def check_password_pepper(app_configs, **kwargs):
+    """部署检查：提示未配置密码 pepper"""
+    if settings.PASSWORD_PEPPER:
+        return []
+    return [
+        Warning(
+            '未设置环境变量 DJANGO_PASSWORD_PEPPER，密码哈希不带 pepper',
+            hint='设置 DJANGO_PASSWORD_PEPPER 后，用户下次登录时密码会自动改用带 pepper 的哈希',
+            id='users.W001',
+        )
+    ]
@@ -0,0 +1,89 @@
+"""
+密码哈希器
+
+在 Argon2 之前先用服务端 pepper 对密码做 HMAC-SHA256 预哈希：
+- HMAC 开销可忽略，Argon2 参数可以按交互式登录的耗时预算适当调低
+- 数据库泄露时，攻击者还需拿到 pepper 才能离线破解
+
+编码格式为 peppered_argon2$<pepper 标识>$argon2id$...，pepper 标识由 pepper 派生，不泄露 pepper 本身。
+
+pepper 轮换：新 pepper 写入 PASSWORD_PEPPER，旧 pepper 放入 PASSWORD_PEPPER_FALLBACKS。
+旧 pepper 生成的哈希仍可校验，并在用户下次登录时用新 pepper 重新哈希；
+全部用户重新登录后即可从 PASSWORD_PEPPER_FALLBACKS 中移除旧 pepper。
+"""
+
+import base64
+import hashlib
+import hmac
+
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+def _pepper_id(pepper: str) -> str:
+    """由 pepper 派生的短标识，用于记录哈希使用的是哪个 pepper"""
+    return hmac.new(pepper.encode(), b'users.hashers.pepper_id', hashlib.sha256).hexdigest()[:8]
+
+
+class PepperedArgon2PasswordHasher(Argon2PasswordHasher):
+    """带 pepper 预哈希的 Argon2 哈希器"""
+
+    algorithm = 'peppered_argon2'
+    time_cost = 2
+    memory_cost = 65536  # KiB，即 64MB
+    parallelism = 2
+
+    @staticmethod
+    def _prehash(password: str, pepper: str) -> str:
+        """使用 pepper 对原始密码做 HMAC-SHA256，返回 Base64 编码的摘要"""
+        digest = hmac.new(
+            pepper.encode(),
+            password.encode(),
+            hashlib.sha256,
+        ).digest()
+        return base64.b64encode(digest).decode('ascii')
+
+    @staticmethod
+    def _peppers() -> list:
+        """当前 pepper 及用于轮换的旧 pepper，当前 pepper 在前"""
+        peppers = [settings.PASSWORD_PEPPER, *getattr(settings, 'PASSWORD_PEPPER_FALLBACKS', [])]
+        return [pepper for pepper in peppers if pepper]
+
+    def _split_pepper_id(self, encoded: str) -> tuple:
+        """
+        拆出 pepper 标识，返回 (pepper 标识, 不含标识的 Argon2 编码)
+
+        早期未记录 pepper 标识的哈希返回 (None, 原编码)
+        """
+        algorithm, rest = encoded.split('$', 1)
+        pepper_id, _, argon2_rest = rest.partition('$')
+        if pepper_id.startswith('argon2'):
+            return None, encoded
+        return pepper_id, f'{algorithm}${argon2_rest}'
+
+    def encode(self, password, salt):
+        pepper = settings.PASSWORD_PEPPER
+        encoded = super().encode(self._prehash(password, pepper), salt)
+        algorithm, rest = encoded.split('$', 1)
+        return f'{algorithm}${_pepper_id(pepper)}${rest}'
+
+    def decode(self, encoded):
+        _, argon2_encoded = self._split_pepper_id(encoded)
+        return super().decode(argon2_encoded)
+
+    def verify(self, password, encoded):
+        pepper_id, argon2_encoded = self._split_pepper_id(encoded)
+        for pepper in self._peppers():
+            # 记录了 pepper 标识时只尝试对应的 pepper
+            if pepper_id is not None and _pepper_id(pepper) != pepper_id:
+                continue
+            if super().verify(self._prehash(password, pepper), argon2_encoded):
+                return True
+        return False
+
+    def must_update(self, encoded):
+        pepper_id, argon2_encoded = self._split_pepper_id(encoded)
+        # 不是用当前 pepper 生成的哈希，登录时重新哈希
+        if pepper_id != _pepper_id(settings.PASSWORD_PEPPER):
+            return True
+        return super().must_update(argon2_encoded)
@@ -5,21 +5,31 @@ from django.contrib.auth.password_validation import validate_password
 User = get_user_model()
 
 
-class UserSerializer(serializers.ModelSerializer):
-    """用户序列化器"""
-    avatar_url = serializers.SerializerMethodField(read_only=True, allow_null=True)
+# 模块级字段实例，复用 DRF 的日期时间格式化逻辑
+_DATETIME_FIELD = serializers.DateTimeField()
 
-    class Meta:
-        model = User
-        fields = ['id', 'email', 'username', 'phone', 'avatar', 'avatar_url', 'date_joined', 'last_login']
-        read_only_fields = ['id', 'date_joined', 'last_login']
 
-    def get_avatar_url(self, obj):
-        """安全地获取头像 URL"""
-        try:
-            return obj.avatar.url if obj.avatar else None
-        except (AttributeError, ValueError):
-            return None
+def serialize_user(user) -> dict:
+    """
+    序列化单个用户
+
+    用户信息输出格式的唯一定义，不构建 DRF 字段，开销更低
+    """
+    try:
+        avatar_url = user.avatar.url if user.avatar else None
+    except (AttributeError, ValueError):
+        avatar_url = None
+
+    return {
+        'id': user.id,
+        'email': user.email,
+        'username': user.username,
+        'phone': user.phone,
+        'avatar': avatar_url,
+        'avatar_url': avatar_url,
+        'date_joined': _DATETIME_FIELD.to_representation(user.date_joined),
+        'last_login': _DATETIME_FIELD.to_representation(user.last_login),
+    }
 
 
 class AvatarUploadSerializer(serializers.Serializer):
@@ -51,14 +61,29 @@ class RegisterSerializer(serializers.ModelSerializer):
 
 
 class LoginSerializer(serializers.Serializer):
-    """登录序列化器"""
+    """
+    登录序列化器
+
+    登录只需按邮箱查找用户，使用简单格式检查代替 EmailField 的完整校验，
+    严格校验保留在注册流程中
+    """
 
-    email = serializers.EmailField(required=True)
+    email = serializers.CharField(required=True, max_length=254)
     password = serializers.CharField(required=True, write_only=True)
 
+    def validate_email(self, value):
+        if '@' not in value:
+            raise serializers.ValidationError('请输入合法的邮件地址。')
+        return value
+
 
 class UpdatePasswordSerializer(serializers.Serializer):
-    """修改密码序列化器"""
+    """
+    修改密码序列化器
+
+    只做廉价校验（新密码强度、两次输入一致），原密码由 UserService.change_password
+    校验，保证每次请求只执行一次密码哈希计算
+    """
 
     old_password = serializers.CharField(required=True, write_only=True)
     new_password = serializers.CharField(required=True, write_only=True, validators=[validate_password])
@@ -69,12 +94,6 @@ class UpdatePasswordSerializer(serializers.Serializer):
             raise serializers.ValidationError({'new_password_confirm': '两次输入的密码不一致'})
         return attrs
 
-    def validate_old_password(self, value):
-        user = self.context['request'].user
-        if not user.check_password(value):
-            raise serializers.ValidationError('原密码错误')
-        return value
-
 
 class ProfileUpdateSerializer(serializers.ModelSerializer):
     """用户资料更新序列化器"""
@@ -5,15 +5,32 @@
 """
 
 import logging
-from django.contrib.auth import get_user_model, authenticate
+from functools import lru_cache
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import check_password, make_password
+from django.utils.crypto import get_random_string
+from django_q.tasks import async_task
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from utils.exceptions import BusinessException, ResourceNotFound, ValidationError
+from ..cache import get_verified_password_hash, cache_verified_password
+from ..tasks import delete_old_avatar_task
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    """
+    用于邮箱不存在时的占位密码哈希
+
+    首次使用时生成，避免在模块导入时执行一次密码哈希
+    """
+    return make_password(get_random_string(32))
+
+
 class UserService:
     """用户服务"""
 
@@ -50,7 +67,7 @@ class UserService:
             **extra_fields
         )
 
-        logger.info(f"用户注册成功: email={email}")
+        logger.info("用户注册成功: email=%s", email)
         return user
 
     @staticmethod
@@ -69,18 +86,27 @@ class UserService:
         Raises:
             ValidationError: 登录失败
         """
-        user = authenticate(request, username=email, password=password)
+        # 仅使用邮箱密码登录，直接查询用户并校验密码，省去认证后端的遍历
+        user = User.objects.filter(email=email).first()
 
         if user is None:
+            # 邮箱不存在时同样执行一次密码哈希，避免通过响应时间枚举已注册邮箱
+            check_password(password, _dummy_password_hash())
             raise ValidationError('邮箱或密码错误')
 
+        # 短时间内以相同凭据登录时复用上次的校验结果，跳过密码哈希
+        if get_verified_password_hash(email, password) != user.password:
+            if not user.check_password(password):
+                raise ValidationError('邮箱或密码错误')
+            cache_verified_password(email, password, user.password)
+
         if not user.is_active:
             raise ValidationError('账户已被禁用')
 
         # 生成 JWT token
         refresh = RefreshToken.for_user(user)
 
-        logger.info(f"用户登录成功: email={email}")
+        logger.info("用户登录成功: email=%s", email)
         return {
             'access': str(refresh.access_token),
             'refresh': str(refresh),
@@ -102,12 +128,16 @@ class UserService:
         # 不允许通过此方法更新的字段
         protected_fields = {'password', 'is_superuser', 'is_staff', 'is_active'}
 
-        for field, value in update_fields.items():
-            if field not in protected_fields and hasattr(user, field):
-                setattr(user, field, value)
+        changed_fields = [
+            field for field in update_fields
+            if field not in protected_fields and hasattr(user, field)
+        ]
+        for field in changed_fields:
+            setattr(user, field, update_fields[field])
 
-        user.save()
-        logger.info(f"用户资料更新: user_id={user.id}")
+        if changed_fields:
+            user.save(update_fields=changed_fields)
+        logger.info("用户资料更新: user_id=%s", user.id)
         return user
 
     @staticmethod
@@ -130,9 +160,9 @@ class UserService:
             raise ValidationError('原密码错误')
 
         user.set_password(new_password)
-        user.save()
+        user.save(update_fields=['password'])
 
-        logger.info(f"用户密码修改: user_id={user.id}")
+        logger.info("用户密码修改: user_id=%s", user.id)
         return True
 
     @staticmethod
@@ -147,15 +177,17 @@ class UserService:
         Returns:
             User: 更新后的用户对象
         """
-        # 删除旧头像
-        if user.avatar:
-            user.avatar.delete(save=False)
+        old_avatar_name = user.avatar.name if user.avatar else None
 
         # 保存新头像
         user.avatar = avatar_file
-        user.save()
+        user.save(update_fields=['avatar'])
+
+        # 旧头像交给后台任务删除，避免存储 I/O 阻塞响应
+        if old_avatar_name:
+            async_task(delete_old_avatar_task, old_avatar_name)
 
-        logger.info(f"用户头像上传: user_id={user.id}")
+        logger.info("用户头像上传: user_id=%s", user.id)
         return user
 
     @staticmethod
@@ -172,7 +204,7 @@ class UserService:
         if user.avatar:
             user.avatar.delete(save=False)
             user.avatar = None
-            user.save()
+            user.save(update_fields=['avatar'])
 
-        logger.info(f"用户头像删除: user_id={user.id}")
+        logger.info("用户头像删除: user_id=%s", user.id)
         return user
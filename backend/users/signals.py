@@ -0,0 +1,18 @@
+"""
+用户信号处理
+
+用户数据变更时失效认证缓存
+"""
+
+from django.conf import settings
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .cache import invalidate_user_cache
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """用户保存或删除后失效缓存"""
+    invalidate_user_cache(instance.pk)
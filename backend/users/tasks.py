@@ -0,0 +1,26 @@
+"""
+Django Q2 异步任务模块
+
+用户相关的后台任务，将不影响响应结果的文件操作移出请求路径
+"""
+
+import logging
+
+from django.core.files.storage import default_storage
+
+logger = logging.getLogger(__name__)
+
+
+def delete_old_avatar_task(name: str) -> None:
+    """
+    删除被替换的旧头像文件
+
+    Args:
+        name: 头像文件在存储中的路径
+    """
+    try:
+        default_storage.delete(name)
+        logger.info("旧头像已删除: name=%s", name)
+    except Exception as e:
+        logger.error("删除旧头像失败: name=%s, error=%s", name, e)
+        raise
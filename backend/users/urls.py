@@ -19,7 +19,9 @@ from .views import AuthViewSet, ProfileViewSet, AvatarViewSet
 app_name = 'users'
 
 # 创建路由器
+# 接口只返回 JSON，不生成 .json 等格式后缀路由，减少一半的 URL 模式
 router = DefaultRouter()
+router.include_format_suffixes = False
 router.register(r'auth', AuthViewSet, basename='auth')
 router.register(r'profile', ProfileViewSet, basename='profile')
 router.register(r'avatar', AvatarViewSet, basename='avatar')
@@ -14,7 +14,7 @@ from utils.viewsets import BaseModelViewSet
 
 from ..services import UserService
 from ..serializers import (
-    UserSerializer,
+    serialize_user,
     RegisterSerializer,
     LoginSerializer,
     UpdatePasswordSerializer,
@@ -32,17 +32,16 @@ class AuthViewSet(viewsets.ViewSet):
     - POST /api/users/auth/login/      # 登录
     """
 
-    # 注册和登录不需要认证
-    permission_classes_by_action = {
-        'register': [AllowAny],
-        'login': [AllowAny],
+    # 注册和登录不需要认证；权限类无状态，在类定义时实例化一次即可复用
+    _PERMS_BY_ACTION = {
+        'register': (AllowAny(),),
+        'login': (AllowAny(),),
     }
+    _DEFAULT_PERMS = (IsAuthenticated(),)
 
     def get_permissions(self):
-        """根据 action 返回权限类"""
-        return [permission() for permission in self.permission_classes_by_action.get(
-            self.action, [IsAuthenticated]
-        )]
+        """根据 action 返回权限实例"""
+        return self._PERMS_BY_ACTION.get(self.action, self._DEFAULT_PERMS)
 
     @action(detail=False, methods=['post'])
     def register(self, request):
@@ -62,7 +61,7 @@ class AuthViewSet(viewsets.ViewSet):
                 password=serializer.validated_data['password']
             )
             return CreatedResponse(
-                data=UserSerializer(user).data,
+                data=serialize_user(user),
                 message='注册成功'
             )
         except ValidationError as e:
@@ -89,7 +88,7 @@ class AuthViewSet(viewsets.ViewSet):
                 data={
                     'access': result['access'],
                     'refresh': result['refresh'],
-                    'user': UserSerializer(result['user']).data,
+                    'user': serialize_user(result['user']),
                 },
                 message='登录成功'
             )
@@ -116,8 +115,7 @@ class ProfileViewSet(viewsets.ViewSet):
 
         GET /api/users/profile/me/
         """
-        serializer = UserSerializer(request.user)
-        return SuccessResponse(data=serializer.data, message='获取用户信息成功')
+        return SuccessResponse(data=serialize_user(request.user), message='获取用户信息成功')
 
     @action(detail=False, methods=['put', 'patch'])
     def edit(self, request):
@@ -138,7 +136,7 @@ class ProfileViewSet(viewsets.ViewSet):
             **serializer.validated_data
         )
         return SuccessResponse(
-            data=UserSerializer(user).data,
+            data=serialize_user(user),
             message='更新用户信息成功'
         )
 
@@ -193,7 +191,7 @@ class AvatarViewSet(viewsets.ViewSet):
             serializer.validated_data['avatar']
         )
         return SuccessResponse(
-            data=UserSerializer(user).data,
+            data=serialize_user(user),
             message='头像上传成功'
         )
 
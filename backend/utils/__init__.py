@@ -25,6 +25,7 @@ from .pagination import (
 )
 
 from .viewsets import (
+    SerializerActionMixin,
     ReadOnlyModelMixin,
     CreateModelMixin,
     UpdateModelMixin,
@@ -61,6 +62,7 @@ __all__ = [
     'LargePagination',
     'SmallPagination',
     # ViewSet
+    'SerializerActionMixin',
     'ReadOnlyModelMixin',
     'CreateModelMixin',
     'UpdateModelMixin',
@@ -116,22 +116,25 @@ def custom_exception_handler(exc, context):
     return response
 
 
+# 状态码对应的中文消息，模块加载时构建一次
+_STATUS_MESSAGES = {
+    200: '成功',
+    201: '创建成功',
+    204: '删除成功',
+    400: '请求参数错误',
+    401: '未授权，请先登录',
+    403: '无权限访问',
+    404: '资源不存在',
+    405: '请求方法不允许',
+    409: '资源冲突',
+    422: '数据验证失败',
+    429: '请求过于频繁',
+    500: '服务器内部错误',
+    502: '网关错误',
+    503: '服务暂不可用',
+}
+
+
 def get_custom_message(status_code: int) -> str:
     """根据状态码返回中文消息"""
-    messages = {
-        200: '成功',
-        201: '创建成功',
-        204: '删除成功',
-        400: '请求参数错误',
-        401: '未授权，请先登录',
-        403: '无权限访问',
-        404: '资源不存在',
-        405: '请求方法不允许',
-        409: '资源冲突',
-        422: '数据验证失败',
-        429: '请求过于频繁',
-        500: '服务器内部错误',
-        502: '网关错误',
-        503: '服务暂不可用',
-    }
-    return messages.get(status_code, '未知错误')
+    return _STATUS_MESSAGES.get(status_code, '未知错误')
@@ -4,7 +4,7 @@
 提供统一的分页响应格式
 """
 
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from rest_framework.response import Response
 
 
@@ -33,17 +33,19 @@ class StandardPagination(PageNumberPagination):
 
     def get_paginated_response(self, data):
         """返回自定义格式的分页响应"""
+        paginator = self.page.paginator
         return Response({
             'code': 200,
             'message': '获取成功',
             'data': data,
             'pagination': {
-                'count': self.page.paginator.count,
+                'count': paginator.count,
                 'next': self.get_next_link(),
                 'previous': self.get_previous_link(),
-                'page_size': self.page_size,
+                # 返回实际生效的每页数量（可能来自 page_size 参数）
+                'page_size': paginator.per_page,
                 'current_page': self.page.number,
-                'total_pages': self.page.paginator.num_pages,
+                'total_pages': paginator.num_pages,
             }
         })
 
@@ -79,3 +81,69 @@ class SmallPagination(StandardPagination):
     """小分页器 - 适用于下拉列表等"""
     page_size = 10
     max_page_size = 50
+
+
+class StandardCursorPagination(CursorPagination):
+    """
+    游标分页器
+
+    按 (created_at, id) 定位下一页，不执行 COUNT，也不使用 OFFSET，
+    翻页代价与页码无关，适合数据量持续增长的列表
+
+    响应格式与 StandardPagination 一致，pagination 中不包含总数和页码:
+    {
+        "code": 200,
+        "message": "获取成功",
+        "data": [...],
+        "pagination": {
+            "next": "http://...?cursor=...",
+            "previous": "http://...?cursor=...",
+            "page_size": 20
+        }
+    }
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-created_at', '-id')
+
+    def get_ordering(self, request, queryset, view):
+        """
+        固定使用 (-created_at, -id) 排序
+
+        忽略客户端的 ordering 参数：游标位置取自排序字段，可为空或不唯一的字段
+        （如 completed_at、retry_count）会导致翻页出错或重复
+        """
+        return self.ordering
+
+    def get_paginated_response(self, data):
+        """返回自定义格式的分页响应"""
+        return Response({
+            'code': 200,
+            'message': '获取成功',
+            'data': data,
+            'pagination': {
+                'next': self.get_next_link(),
+                'previous': self.get_previous_link(),
+                'page_size': self.page_size,
+            }
+        })
+
+    def get_paginated_response_schema(self, schema):
+        """OpenAPI schema"""
+        return {
+            'type': 'object',
+            'properties': {
+                'code': {'type': 'integer', 'example': 200},
+                'message': {'type': 'string', 'example': '获取成功'},
+                'data': schema,
+                'pagination': {
+                    'type': 'object',
+                    'properties': {
+                        'next': {'type': 'string', 'nullable': True},
+                        'previous': {'type': 'string', 'nullable': True},
+                        'page_size': {'type': 'integer'},
+                    }
+                }
+            }
+        }
@@ -4,100 +4,120 @@ from typing import Any, Dict, Optional
 
 
 class APIResponse(Response):
-    """统一 API 响应格式"""
+    """
+    统一 API 响应格式
+
+    子类通过类属性 default_code / default_message 声明状态码和默认消息
+    """
+
+    default_code = status.HTTP_200_OK
+    default_message = "成功"
 
     def __init__(
         self,
         data: Any = None,
-        code: int = status.HTTP_200_OK,
-        message: str = "成功",
+        code: Optional[int] = None,
+        message: Optional[str] = None,
         **kwargs
     ):
-        formatted_data = {
-            "code": code,
-            "message": message,
-            "data": data,
-        }
-        super().__init__(formatted_data, status=code, **kwargs)
+        if code is None:
+            code = self.default_code
+        if message is None:
+            message = self.default_message
+        super().__init__({"code": code, "message": message, "data": data}, status=code, **kwargs)
 
 
 class SuccessResponse(APIResponse):
     """成功响应"""
 
-    def __init__(self, data: Any = None, message: str = "成功", **kwargs):
-        super().__init__(data, status.HTTP_200_OK, message, **kwargs)
+    def __init__(self, data: Any = None, message: Optional[str] = None, **kwargs):
+        super().__init__(data, self.default_code, message, **kwargs)
 
 
-class CreatedResponse(APIResponse):
+class CreatedResponse(SuccessResponse):
     """创建成功响应"""
 
-    def __init__(self, data: Any = None, message: str = "创建成功", **kwargs):
-        super().__init__(data, status.HTTP_201_CREATED, message, **kwargs)
+    default_code = status.HTTP_201_CREATED
+    default_message = "创建成功"
 
 
 class NoContentResponse(APIResponse):
     """无内容响应"""
 
-    def __init__(self, message: str = "删除成功", **kwargs):
-        super().__init__(None, status.HTTP_204_NO_CONTENT, message, **kwargs)
+    default_code = status.HTTP_204_NO_CONTENT
+    default_message = "删除成功"
+
+    def __init__(self, message: Optional[str] = None, **kwargs):
+        super().__init__(None, self.default_code, message, **kwargs)
 
 
 class ErrorResponse(Response):
     """错误响应"""
 
+    default_code = status.HTTP_400_BAD_REQUEST
+    default_message = "错误"
+
     def __init__(
         self,
-        message: str = "错误",
-        code: int = status.HTTP_400_BAD_REQUEST,
+        message: Optional[str] = None,
+        code: Optional[int] = None,
         detail: Any = None,
         **kwargs
     ):
-        formatted_data = {
-            "code": code,
-            "message": message,
-        }
+        if code is None:
+            code = self.default_code
+        if message is None:
+            message = self.default_message
+        formatted_data = {"code": code, "message": message}
         if detail is not None:
             formatted_data["detail"] = detail
         super().__init__(formatted_data, status=code, **kwargs)
 
 
-class BadRequestResponse(ErrorResponse):
+class _StatusErrorResponse(ErrorResponse):
+    """固定状态码的错误响应基类"""
+
+    def __init__(self, message: Optional[str] = None, detail: Any = None, **kwargs):
+        super().__init__(message, self.default_code, detail, **kwargs)
+
+
+class BadRequestResponse(_StatusErrorResponse):
     """400 错误"""
 
-    def __init__(self, message: str = "请求参数错误", detail: Any = None, **kwargs):
-        super().__init__(message, status.HTTP_400_BAD_REQUEST, detail, **kwargs)
+    default_code = status.HTTP_400_BAD_REQUEST
+    default_message = "请求参数错误"
 
 
-class UnauthorizedResponse(ErrorResponse):
+class UnauthorizedResponse(_StatusErrorResponse):
     """401 错误"""
 
-    def __init__(self, message: str = "未授权，请先登录", detail: Any = None, **kwargs):
-        super().__init__(message, status.HTTP_401_UNAUTHORIZED, detail, **kwargs)
+    default_code = status.HTTP_401_UNAUTHORIZED
+    default_message = "未授权，请先登录"
 
 
-class ForbiddenResponse(ErrorResponse):
+class ForbiddenResponse(_StatusErrorResponse):
     """403 错误"""
 
-    def __init__(self, message: str = "无权限访问", detail: Any = None, **kwargs):
-        super().__init__(message, status.HTTP_403_FORBIDDEN, detail, **kwargs)
+    default_code = status.HTTP_403_FORBIDDEN
+    default_message = "无权限访问"
 
 
-class NotFoundResponse(ErrorResponse):
+class NotFoundResponse(_StatusErrorResponse):
     """404 错误"""
 
-    def __init__(self, message: str = "资源不存在", detail: Any = None, **kwargs):
-        super().__init__(message, status.HTTP_404_NOT_FOUND, detail, **kwargs)
+    default_code = status.HTTP_404_NOT_FOUND
+    default_message = "资源不存在"
 
 
-class ValidationErrorResponse(ErrorResponse):
+class ValidationErrorResponse(_StatusErrorResponse):
     """422 验证错误"""
 
-    def __init__(self, message: str = "数据验证失败", detail: Any = None, **kwargs):
-        super().__init__(message, status.HTTP_422_UNPROCESSABLE_ENTITY, detail, **kwargs)
+    default_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    default_message = "数据验证失败"
 
 
-class InternalErrorResponse(ErrorResponse):
+class InternalErrorResponse(_StatusErrorResponse):
     """500 错误"""
 
-    def __init__(self, message: str = "服务器内部错误", detail: Any = None, **kwargs):
-        super().__init__(message, status.HTTP_500_INTERNAL_SERVER_ERROR, detail, **kwargs)
+    default_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    default_message = "服务器内部错误"
@@ -5,6 +5,7 @@
 """
 
 from rest_framework import status, viewsets
+from rest_framework.settings import api_settings
 
 from utils.responses import (
     SuccessResponse,
@@ -13,6 +14,26 @@ from utils.responses import (
 )
 
 
+class SerializerActionMixin:
+    """
+    按 action 选择序列化器的 Mixin
+
+    子类定义 serializer_action_classes 映射，未命中时回退到 serializer_class
+
+    示例:
+        serializer_class = MySerializer
+        serializer_action_classes = {
+            'create': MyCreateSerializer,
+        }
+    """
+
+    serializer_action_classes = {}
+
+    def get_serializer_class(self):
+        """根据 action 返回序列化器类"""
+        return self.serializer_action_classes.get(self.action) or super().get_serializer_class()
+
+
 class ReadOnlyModelMixin:
     """
     只读 Model Mixin
@@ -50,7 +71,10 @@ class CreateModelMixin:
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         self.perform_create(serializer)
-        headers = self.get_success_headers(serializer.data)
+        # 只有序列化器包含 url 字段时才需要生成 Location 头
+        headers = None
+        if api_settings.URL_FIELD_NAME in serializer.fields:
+            headers = self.get_success_headers(serializer.data)
         return CreatedResponse(serializer.data, headers=headers)
 
     def perform_create(self, serializer):
@@ -94,6 +118,7 @@ class DestroyModelMixin:
 
 
 class BaseModelViewSet(
+    SerializerActionMixin,
     CreateModelMixin,
     ReadOnlyModelMixin,
     UpdateModelMixin,
@@ -106,7 +131,7 @@ class BaseModelViewSet(
     提供完整的 CRUD 操作，子类只需定义:
     - queryset
     - serializer_class
-    - (可选) permission_classes, filter_backends 等
+    - (可选) serializer_action_classes, permission_classes, filter_backends 等
 
     示例:
         class MyViewSet(BaseModelViewSet):
@@ -116,7 +141,7 @@ class BaseModelViewSet(
     pass
 
 
-class ReadOnlyViewSet(ReadOnlyModelMixin, viewsets.GenericViewSet):
+class ReadOnlyViewSet(SerializerActionMixin, ReadOnlyModelMixin, viewsets.GenericViewSet):
     """
     只读 ViewSet
 